@@ -36,39 +36,102 @@ class Card:
         self.suit = suit
         self.rank = rank
         self.effect = self._init_effect(suit, rank)
+        self._has_effect = self.effect is not Card.Effect.NONE
+        self._value = _RANK_VALUE[rank]
+        # Stable id in [0, 54), usable for compact encodings of hands
+        index = _CARD_INDEX.get((suit, rank))
+        if index is None:
+            raise ValueError(f"Invalid card: rank {rank} with suit {suit}.")
+        self._index = index
+        if rank == Card.Rank.JOKER_BLACK:
+            self._repr = "★Black Joker★"
+        elif rank == Card.Rank.JOKER_RED:
+            self._repr = "★Red Joker★"
+        else:
+            self._repr = f"{rank.value}{suit.value}"
+
+    @staticmethod
+    def get(suit, rank) -> "Card":
+        """Return the shared Card instance for (suit, rank).
+
+        Cards are never mutated after construction, so the whole deck can be
+        built from a single table of 54 instances.
+        """
+        return _CARDS[(suit, rank)]
+
+    @staticmethod
+    def from_index(index: int) -> "Card":
+        """Return the shared Card instance whose id is `index`."""
+        return _CARDS_BY_INDEX[index]
+
+    @staticmethod
+    def encode(cards) -> bytes:
+        """Encode a sequence of `Card | None` as the bytes of the card ids.
+
+        Unknown cards (None) are encoded as 255.
+        """
+        return bytes(255 if card is None else card._index for card in cards)
 
     def __repr__(self):
-        if self.rank in [Card.Rank.JOKER_RED, Card.Rank.JOKER_BLACK]:
-            return "★Black Joker★" if self.rank == Card.Rank.JOKER_BLACK else "★Red Joker★"
-        return f"{self.rank.value}{self.suit.value}"
+        return self._repr
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, Card):
             return self.suit == other.suit and self.rank == other.rank
         return False
 
+    def __hash__(self):
+        return hash((self.suit, self.rank))
+
     @staticmethod
     def _init_effect(suit, rank):
-        if rank == Card.Rank.KING:
-            effect = (
-                Card.Effect.SHUFFLE
-                if suit in [Card.Suit.HEARTS, Card.Suit.DIAMONDS]
-                else Card.Effect.DRAW
-            )
-        elif rank == Card.Rank.QUEEN:
-            effect = Card.Effect.SWAP
-        elif rank == Card.Rank.JACK:
-            effect = Card.Effect.PEEK
-        else:
-            effect = Card.Effect.NONE
-        return effect
+        return _EFFECT_TABLE.get((suit, rank), _RANK_EFFECT.get(rank, Card.Effect.NONE))
 
     def value(self):
-        if self.rank in [Card.Rank.JOKER_RED, Card.Rank.JOKER_BLACK]:
-            return 0
-        elif self.rank in [Card.Rank.JACK, Card.Rank.QUEEN, Card.Rank.KING]:
-            return 10
-        elif self.rank == Card.Rank.ACE:
-            return 1
-        else:
-            return int(self.rank)
+        return self._value
+
+
+# Lookup tables, built once at import time
+_RANK_VALUE = {
+    Card.Rank.ACE: 1,
+    Card.Rank.TWO: 2,
+    Card.Rank.THREE: 3,
+    Card.Rank.FOUR: 4,
+    Card.Rank.FIVE: 5,
+    Card.Rank.SIX: 6,
+    Card.Rank.SEVEN: 7,
+    Card.Rank.EIGHT: 8,
+    Card.Rank.NINE: 9,
+    Card.Rank.TEN: 10,
+    Card.Rank.JACK: 10,
+    Card.Rank.QUEEN: 10,
+    Card.Rank.KING: 10,
+    Card.Rank.JOKER_RED: 0,
+    Card.Rank.JOKER_BLACK: 0,
+}
+
+# Kings depend on their suit, the other face cards only on their rank
+_EFFECT_TABLE = {
+    (Card.Suit.HEARTS, Card.Rank.KING): Card.Effect.SHUFFLE,
+    (Card.Suit.DIAMONDS, Card.Rank.KING): Card.Effect.SHUFFLE,
+    (Card.Suit.SPADES, Card.Rank.KING): Card.Effect.DRAW,
+    (Card.Suit.CLUBS, Card.Rank.KING): Card.Effect.DRAW,
+}
+_RANK_EFFECT = {
+    Card.Rank.QUEEN: Card.Effect.SWAP,
+    Card.Rank.JACK: Card.Effect.PEEK,
+}
+
+# Flyweight table of the 54 cards of a deck, in id order
+_DECK_ORDER = [
+    (suit, rank)
+    for suit in Card.Suit
+    for rank in Card.Rank
+    if rank not in [Card.Rank.JOKER_RED, Card.Rank.JOKER_BLACK]
+]
+_DECK_ORDER += [(None, Card.Rank.JOKER_RED), (None, Card.Rank.JOKER_BLACK)]
+_CARD_INDEX = {key: i for i, key in enumerate(_DECK_ORDER)}
+_CARDS_BY_INDEX = [Card(suit, rank) for suit, rank in _DECK_ORDER]
+_CARDS = {(card.suit, card.rank): card for card in _CARDS_BY_INDEX}
@@ -15,12 +15,16 @@ class Dealer:
 
     class View:
         def __init__(self, dealer: "Dealer"):
-            self.draw_pile_size = len(dealer.draw_pile)
-            self.discard_pile = dealer.discard_pile
+            # Read the dealer lazily so the view never needs to be refreshed
+            self._dealer = dealer
 
-        def update(self, dealer: "Dealer"):
-            self.draw_pile_size = len(dealer.draw_pile)
-            self.discard_pile = dealer.discard_pile
+        @property
+        def draw_pile_size(self) -> int:
+            return len(self._dealer.draw_pile)
+
+        @property
+        def discard_pile(self) -> list[Card]:
+            return self._dealer.discard_pile
 
         def __repr__(self, indent: str = "") -> str:
             """Provides a clean, indented representation of the dealer's view."""
@@ -35,9 +39,13 @@ class Dealer:
                 f"{indent}   )"
             )
 
-    def __init__(self, hand_size: int = 5, treasure_size: int = 3):
+    def __init__(
+        self, hand_size: int = 5, treasure_size: int = 3, rng: random.Random = None
+    ):
         self.hand_size = hand_size
         self.treasure_size = treasure_size
+        # Private generator so that seeded games are reproducible
+        self._rng = rng if rng is not None else random.Random()
         self.deck = self.init_deck()
         self.draw_pile: list[Card] = self.deck[:]
         self.discard_pile: list[Card] = []
@@ -46,57 +54,67 @@ class Dealer:
 
     def init_deck(self):
         deck = [
-            Card(suit, rank)
+            Card.get(suit, rank)
             for suit in Card.Suit
             for rank in Card.Rank
             if rank not in [Card.Rank.JOKER_RED, Card.Rank.JOKER_BLACK]
         ]
-        deck += [Card(None, Card.Rank.JOKER_RED), Card(None, Card.Rank.JOKER_BLACK)]
+        deck += [Card.get(None, Card.Rank.JOKER_RED), Card.get(None, Card.Rank.JOKER_BLACK)]
         return deck
 
     def reset_deck(self):
+        # The draw pile is left in deck order: it is shuffled lazily, one
+        # card at a time, as cards are drawn (see _pop_random).
         self.draw_pile = self.deck[:]
-        random.shuffle(self.draw_pile)
         self.discard_pile = []
         self.treasure = []
-        self.view.update(self)
 
     def reshuffle_discard_into_draw(self):
         discard_top = self.discard_pile.pop() if self.discard_pile else None
         self.draw_pile = self.discard_pile[:]
-        random.shuffle(self.draw_pile)
         self.discard_pile = [] if discard_top is None else [discard_top]
 
     def deal_initial_hands(self, hands: dict[str, list[Card]]):
         if len(self.draw_pile) < (len(hands) * self.hand_size + self.treasure_size + 1):
             raise ValueError("Not enough cards to deal initial hands and treasure.")
+        # Hands from a previous round are replaced, not extended
+        for hand in hands.values():
+            hand.clear()
         # Deal hands
         for _ in range(self.hand_size):
             for player in hands.keys():
-                card = self.draw_pile.pop()
+                card = self._pop_random()
                 hands[player].append(card)
         # Deal treasure
         for _ in range(self.treasure_size):
-            card = self.draw_pile.pop()
+            card = self._pop_random()
             self.treasure.append(card)
         # Start discard pile
-        card = self.draw_pile.pop()
+        card = self._pop_random()
         self.discard_pile.append(card)
-        self.view.update(self)
+
+    def _pop_random(self) -> Card:
+        """Remove and return a uniformly random card of the draw pile.
+
+        This is one step of a Fisher-Yates shuffle performed from the end of
+        the pile, so drawing k cards costs O(k) instead of shuffling the
+        whole pile upfront, with the same distribution.
+        """
+        draw_pile = self.draw_pile
+        j = self._rng.randrange(len(draw_pile))
+        draw_pile[j], draw_pile[-1] = draw_pile[-1], draw_pile[j]
+        return draw_pile.pop()
 
     def draw_from_draw(self):
         if not self.draw_pile:
             self.reshuffle_discard_into_draw()
         if self.draw_pile:
-            card = self.draw_pile.pop()
-            self.view.update(self)
-            return card
+            return self._pop_random()
         raise ValueError("Deck is empty.")
 
     def draw_from_discard(self):
         if self.discard_pile:
             card = self.discard_pile.pop()
-            self.view.update(self)
             return card
         raise ValueError("Discard pile is empty.")
 
@@ -109,4 +127,3 @@ class Dealer:
 
     def discard(self, card: Card):
         self.discard_pile.append(card)
-        self.view.update(self)
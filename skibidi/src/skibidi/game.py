@@ -1,12 +1,12 @@
 import logging
 import random
+from collections import deque
 from typing import Any
 
 from skibidi.card import Card
 from skibidi.dealer import Dealer
 from skibidi.player import Player
 
-# TODO: module-level logger
 logger = logging.getLogger(__name__)
 
 
@@ -15,7 +15,7 @@ class Game:
     class View:
         def __init__(self, game: "Game"):
             self.dealer_view: Dealer.View = game.dealer.view
-            self.effects_queue: list[tuple[Player, Card.Effect]] = []
+            self.effects_queue: deque[tuple[Player, Card.Effect]] = deque()
             self.players_order: list[str] = [p.name for p in game.players]
             self.current_player_index: int = 0
             self.caller_index: int = -1
@@ -23,9 +23,24 @@ class Game:
             self.round = 0
 
         def update(self, game: "Game"):
-            self.dealer_view.update(game.dealer)
             self.current_player_index = game.current_player_index
 
+        def state_key(self) -> tuple:
+            """Return a hashable summary of the public state of the game.
+
+            Two views with the same key are indistinguishable to a strategy,
+            which can use it to memoize decisions.
+            """
+            return (
+                self.round,
+                self.current_player_index,
+                self.caller_index,
+                self.dealer_view.draw_pile_size,
+                Card.encode(self.dealer_view.discard_pile),
+                tuple(self.scores),
+                tuple((p.name, e.value) for p, e in self.effects_queue),
+            )
+
         def __repr__(self, indent: str = "") -> str:
 
             effects_str = f"[{', '.join(f'({p.name}, {e.value})' for p, e in self.effects_queue)}]"
@@ -51,6 +66,7 @@ class Game:
         treasure_size: int = 3,
         initially_known: int = 2,
         verbose: bool = False,
+        seed: int = None,
     ):
         # Configure module logger based on verbose flag. If verbose is True
         # ensure a StreamHandler exists so info messages are visible to the console.
@@ -74,11 +90,21 @@ class Game:
         #    safely inspect game.players and dealer sizes.
         # 5. Finally create Game.View which depends on the completed players
         #    list and the dealer view.
-        self.dealer: Dealer = Dealer(hand_size, treasure_size)
+        # A single generator drives the dealer and the game so that a seed
+        # makes the whole game reproducible (given deterministic strategies).
+        self._rng = random.Random(seed)
+        self.dealer: Dealer = Dealer(hand_size, treasure_size, self._rng)
         if names is None:
             names = [f"Player {i + 1}" for i in range(n_players)]
+        if len(set(names)) != len(names):
+            raise ValueError("Player names must be unique.")
         # Create players in the order of provided names
         self.players: list[Player] = [Player(self, name) for name in names]
+        # Lookup tables, the list of players never changes after construction
+        self._players_by_name: dict[str, Player] = {p.name: p for p in self.players}
+        self._opponents_of: dict[str, list[Player]] = {
+            p.name: [o for o in self.players if o is not p] for p in self.players
+        }
 
         # Initialize empty hands using player names
         self.hands: dict[str, list[Card]] = {p.name: [] for p in self.players}
@@ -95,6 +121,14 @@ class Game:
 
         self.current_player_index: int = 0
 
+        # Effects without a handler (Card.Effect.NONE) are ignored
+        self._effect_handlers = {
+            Card.Effect.DRAW: self._effect_draw,
+            Card.Effect.SHUFFLE: self._effect_shuffle,
+            Card.Effect.SWAP: self._effect_swap,
+            Card.Effect.PEEK: self._effect_peek,
+        }
+
         # Create view after players exist so scores length is correct
         self.view: Game.View = Game.View(self)
 
@@ -105,146 +139,179 @@ class Game:
                 raise ValueError(f"Player {player.name} has no strategy assigned.")
 
         while not self.is_finished():
-            self.init_round()
-            while (
-                self.view.caller_index < 0 or self.current_player_index != self.view.caller_index
-            ):
-                # Player turn
-                current_player = self.players[self.current_player_index]
-                logger.info(f"[GameMaster]: ## Player {current_player.name}'s turn ##")
-
-                # Choose draw source and draw card
-                source = current_player.strategy.select_draw_pile(
-                    self.view, current_player.view
-                )
-                card = self.dealer.draw(source)
-                logger.info(
-                    f"[GameMaster]: Player {current_player.name} drew card from {source}."
-                )
-
-                # Update player's view
-                current_player.view.drawn_card = card
-
-                # Decide which card to exchange
-                exchange_index = current_player.strategy.select_card_to_exchange(
-                    self.view, current_player.view, source
-                )
-                while exchange_index < 0 and source == Dealer.Source.DISCARD:
-                    logger.info(
-                        "[GameMaster]: Invalid choice, cannot discard a card taken from discard pile."
-                    )
-                    exchange_index = current_player.strategy.select_card_to_exchange(
-                        self.view, current_player.view, source
-                    )
-
-                # Exchange or discard the card depending on the decision
-                if exchange_index == -1:
-                    self.discard(current_player, card=card)
-                else:
-                    old_card = self.exchange(current_player, exchange_index, card)
-                    if source == Dealer.Source.DISCARD:
-                        self.reveal_to_others(current_player, exchange_index, card)
-                    self.discard(current_player, card=old_card)
-
-                # Other players discard their cards
-                self.allow_discards(current_player)
-
-                # Applying effects of cards
-                while self.view.effects_queue:
-                    player, effect = self.view.effects_queue.pop(0)
-                    decision = player.strategy.decide_effect(
-                        self.view, player.view, effect
-                    )
-                    self.apply_effect(player, effect, decision)
-
-                # Decide whether to call
-                if self.view.caller_index < 0:  # No one has called yet
-                    call_discard_index = current_player.strategy.decide_call(
-                        self.view, current_player.view
-                    )
-                    if 0 <= call_discard_index < len(self.hands[current_player.name]):
-                        logger.info(
-                            f"[GameMaster]: Player {current_player.name} calls the end of the round!"
-                        )
-                        if len(self.hands[current_player.name]) > 1:
-                            self.discard(current_player, idx=call_discard_index)
-                            self.view.caller_index = self.current_player_index
-                            # Other players discard their cards
-                            self.allow_discards(current_player)
-                        else:
-                            logger.info(
-                                f"[GameMaster]: No card discarded while calling."
-                            )
-                    else:
-                        logger.info(f"[GameMaster]: Player {current_player.name} did not call.")
-
-                self.current_player_index = (self.current_player_index + 1) % len(
-                    self.players
-                )
-                self.view.update(self)
-            # End of round
-            self.end_round()
+            self.play_round()
         # Game over
         self.end_game()
 
-    def get_player_by_name(self, name: str) -> Player:
+    def reset(self):
+        """Rewind the game to its initial state, reusing players, views and deck."""
+        view = self.view
+        view.scores[:] = [0] * len(self.players)
+        view.round = 0
+        view.caller_index = -1
+        view.effects_queue.clear()
+        self.current_player_index = 0
+        view.update(self)
+        self.dealer.reset_deck()
+        for hand in self.hands.values():
+            hand.clear()
         for player in self.players:
-            if player.name == name:
-                return player
-        raise ValueError(f"No player found with name {name}.")
+            player.view.reset(self, player)
+
+    def play_many(self, n: int) -> list[list[int]]:
+        """Play `n` games in a row with the same players and strategies.
+
+        Returns:
+            list[list[int]]: The final scores of each game, in player order.
+        """
+        results = []
+        for _ in range(n):
+            self.reset()
+            self.play()
+            results.append(self.view.scores[:])
+        return results
+
+    def play_round(self):
+        """Play a full round, from the deal until the turn comes back to the caller."""
+        self.init_round()
+        view = self.view
+        players = self.players
+        n_players = len(players)
+        while view.caller_index < 0 or self.current_player_index != view.caller_index:
+            self._play_turn(players[self.current_player_index])
+            self.current_player_index = (self.current_player_index + 1) % n_players
+            view.update(self)
+        # End of round
+        self.end_round()
+
+    def _play_turn(self, current_player: Player):
+        public = self.view
+        private = current_player.view
+        name = current_player.name
+        strategy = current_player.strategy
+        logger.info("[GameMaster]: ## Player %s's turn ##", name)
+
+        # Choose draw source and draw card
+        source = strategy.select_draw_pile(public, private)
+        card = self.dealer.draw(source)
+        logger.info("[GameMaster]: Player %s drew card from %s.", name, source)
+
+        # Update player's view
+        private.drawn_card = card
+
+        # Decide which card to exchange
+        select_card_to_exchange = strategy.select_card_to_exchange
+        exchange_index = select_card_to_exchange(public, private, source)
+        while exchange_index < 0 and source == Dealer.Source.DISCARD:
+            logger.info(
+                "[GameMaster]: Invalid choice, cannot discard a card taken from discard pile."
+            )
+            exchange_index = select_card_to_exchange(public, private, source)
+
+        # Exchange or discard the card depending on the decision
+        if exchange_index == -1:
+            self.discard(current_player, card=card)
+        else:
+            old_card = self.exchange(current_player, exchange_index, card)
+            if source == Dealer.Source.DISCARD:
+                self.reveal_to_others(current_player, exchange_index, card)
+            self.discard(current_player, card=old_card)
+
+        # Other players discard their cards
+        self.allow_discards(current_player)
+
+        # Applying effects of cards
+        effects_queue = public.effects_queue
+        while effects_queue:
+            player, effect = effects_queue.popleft()
+            decision = player.strategy.decide_effect(public, player.view, effect)
+            self.apply_effect(player, effect, decision)
+
+        # Decide whether to call
+        if public.caller_index < 0:  # No one has called yet
+            call_discard_index = strategy.decide_call(public, private)
+            hand_size = len(self.hands[name])
+            # With one card or none left, any non-negative index is a call
+            if 0 <= call_discard_index < max(hand_size, 1):
+                logger.info("[GameMaster]: Player %s calls the end of the round!", name)
+                public.caller_index = self.current_player_index
+                if hand_size > 1:
+                    self.discard(current_player, idx=call_discard_index)
+                    # Other players discard their cards
+                    self.allow_discards(current_player)
+                else:
+                    logger.info("[GameMaster]: No card discarded while calling.")
+            else:
+                logger.info("[GameMaster]: Player %s did not call.", name)
+
+    def get_player_by_name(self, name: str) -> Player:
+        player = self._players_by_name.get(name)
+        if player is None:
+            raise ValueError(f"No player found with name {name}.")
+        return player
 
     # TODO: problem here
     def discard(self, player: Player, card: Card = None, idx: int = None):
         if card is None and idx is None:
             raise ValueError("Either card or idx must be provided.")
+        name = player.name
+        hand = self.hands[name]
         if card is not None:  # Discard the provided card
             player.view.drawn_card = None
-        elif not (0 <= idx < len(self.hands[player.name])):
+        elif not (0 <= idx < len(hand)):
             raise ValueError("Invalid index for discard.")
         else:  # Discard the card at the provided index
-            card = self.hands[player.name].pop(idx)
+            # Hands are kept as plain lists and shifted with pop(idx): card
+            # positions are what strategies, views and effects refer to, so
+            # the order must be preserved in the hand and in every view.
+            card = hand.pop(idx)
             # Update player's view
             player.view.hand.pop(idx)
             # Update opponents' views
-            for opponent in self.players:
-                if opponent != player:
-                    opponent.view.opponents_hands[player.name].pop(idx)
+            for opponent in self._opponents_of[name]:
+                opponent.view.opponents_hands[name].pop(idx)
         self.dealer.discard(card)
-        logger.info(f"[GameMaster]: Player {player.name} discards {card}.")
-        if card.effect != Card.Effect.NONE:
+        logger.info("[GameMaster]: Player %s discards %s.", player.name, card)
+        if card._has_effect:
             self.view.effects_queue.append((player, card.effect))
 
     def exchange(
         self, player: Player, idx: int, card: Card, reveal: bool = True
     ) -> Card:
-        if not (0 <= idx < len(self.hands[player.name])):
+        hand = self.hands[player.name]
+        if not (0 <= idx < len(hand)):
             raise ValueError("Invalid index for exchange.")
-        old_card = self.hands[player.name][idx]
-        self.hands[player.name][idx] = card
+        old_card = hand[idx]
+        hand[idx] = card
         if reveal:
             player.learn_card(idx, card)
+        # Opponents do not see the new card unless it is revealed to them
+        for opponent in self._opponents_of[player.name]:
+            opponent.view.opponents_hands[player.name][idx] = None
         logger.info(
-            f"[GameMaster]: Player {player.name} exchanges the drawn card with his card at index {idx}."
+            "[GameMaster]: Player %s exchanges the drawn card with his card at index %s.",
+            player.name,
+            idx,
         )
         return old_card
 
     def penalize(self, player: Player):
         """Give a penalty card to the player and add a None to their view hand."""
         logger.info(
-            f"[GameMaster]: Player {player.name} was penalized and drawn a penalty card."
+            "[GameMaster]: Player %s was penalized and drawn a penalty card.",
+            player.name,
         )
+        name = player.name
         penalty_card = self.dealer.draw(Dealer.Source.DRAW)
-        self.hands[player.name].append(penalty_card)
+        self.hands[name].append(penalty_card)
         player.view.hand.append(None)
-        for opponent in self.players:
-            if opponent != player:
-                opponent.view.opponents_hands[player.name].append(None)
+        for opponent in self._opponents_of[name]:
+            opponent.view.opponents_hands[name].append(None)
 
     def reveal_to_others(self, player: Player, idx: int, card: Card):
         # Update all opponents' views
-        for opponent in self.players:
-            if opponent != player:
-                opponent.learn_opponent_card(player, idx, card)
+        for opponent in self._opponents_of[player.name]:
+            opponent.learn_opponent_card(player, idx, card)
 
     def allow_discards(self, player: Player, player_relative_speed: int = 5):
         """Allow players to discard a card that is similar to the top of the discard pile.
@@ -259,131 +326,156 @@ class Game:
             return
 
         logger.info(
-            f"[GameMaster]: Allowing players to discard cards similar to {card} - Be fast!"
+            "[GameMaster]: Allowing players to discard cards similar to %s - Be fast!",
+            card,
         )
         # TODO: allow for chaining heads over heads.
-        # Players want to discard (they can make errors and be penalized)
+        # Players want to discard (they can make errors and be penalized).
+        # Every player is polled again on each chain iteration: an iteration
+        # only continues after a discard or a penalty, and both change every
+        # player's view, so earlier decisions cannot be reused.
+        hands = self.hands
+        public = self.view
+        # Resolve each player's decision method once for the whole chain
+        deciders = [(p, p.strategy.select_card_to_discard) for p in self.players]
         while True:  # For chaining discards of special cards
-            discard_idx = [
-                (p, p.strategy.select_card_to_discard(self.view, p.view))
-                for p in self.players
-            ]
-            discard_idx = [
-                (p, idx) for p, idx in discard_idx if 0 <= idx < len(self.hands[p.name])
-            ]  # Valid discards
+            discard_idx = []
+            for p, select_card_to_discard in deciders:
+                idx = select_card_to_discard(public, p.view)
+                if 0 <= idx < len(hands[p.name]):  # Valid discards
+                    discard_idx.append((p, idx))
             if discard_idx:
-                speeds = [
-                    1 if p != player else player_relative_speed for p, _ in discard_idx
-                ]
-
-                # Select the fastest player among those who want to discard
-                p, idx = random.choices(discard_idx, weights=speeds)[0]
-                logger.info(f"[GameMaster]: Player {p.name} was the fastest!")
-                card_to_discard = self.hands[p.name][idx]
+                if len(discard_idx) == 1:
+                    p, idx = discard_idx[0]
+                else:
+                    speeds = [
+                        1 if p is not player else player_relative_speed
+                        for p, _ in discard_idx
+                    ]
+                    # Select the fastest player among those who want to discard
+                    p, idx = self._rng.choices(discard_idx, weights=speeds)[0]
+                logger.info("[GameMaster]: Player %s was the fastest!", p.name)
+                card_to_discard = hands[p.name][idx]
                 if card_to_discard.rank != card.rank:
                     logger.info(
-                        f"[GameMaster]: Player {p.name} attempted to discard {card_to_discard}, but top of discard pile is {card}. Penalizing."
+                        "[GameMaster]: Player %s attempted to discard %s, but top of discard pile is %s. Penalizing.",
+                        p.name,
+                        card_to_discard,
+                        card,
                     )
+                    # The card was shown, so the player stops retrying it
+                    p.learn_card(idx, card_to_discard)
                     self.penalize(p)
                 else:
                     self.discard(p, idx=idx)
-            if card.effect != Card.Effect.NONE:
-                logger.info(f"[GameMaster]: Continuing discard chain - Try again!")
+            if card._has_effect:
+                logger.info("[GameMaster]: Continuing discard chain - Try again!")
 
-            if not discard_idx or card.effect == Card.Effect.NONE:
+            if not discard_idx or not card._has_effect:
                 break
 
     def apply_effect(self, player: Player, effect: Card.Effect, decision: Any):
-        logger.info(f"[GameMaster]: Player {player.name} triggered {effect.value}.")
-        if effect == Card.Effect.DRAW:
-            target_name = decision
-            target_player = self.get_player_by_name(target_name)
-            self.penalize(target_player)
-
-        # TODO: think about how to make it more realistic
-        elif effect == Card.Effect.SHUFFLE:
-            target_name = decision
-            target_player = self.get_player_by_name(target_name)
-            random.shuffle(self.hands[target_player.name])
-            target_player.view.hand = [None] * len(target_player.view.hand)
-            logger.info(
-                f"[GameMaster]: Player {target_player.name}'s hand has been shuffled."
-            )
+        logger.info("[GameMaster]: Player %s triggered %s.", player.name, effect.value)
+        if decision is None:
+            # Strategies return None to pass on an effect (e.g. no valid target)
+            logger.info("[GameMaster]: Player %s passes on %s.", player.name, effect.value)
+            return
+        handler = self._effect_handlers.get(effect)
+        if handler is not None:
+            handler(player, decision)
+
+    def _effect_draw(self, player: Player, decision: str):
+        target_player = self.get_player_by_name(decision)
+        self.penalize(target_player)
+
+    # TODO: think about how to make it more realistic
+    def _effect_shuffle(self, player: Player, decision: str):
+        target_player = self.get_player_by_name(decision)
+        name = target_player.name
+        self._rng.shuffle(self.hands[name])
+        target_player.view.hand = [None] * len(target_player.view.hand)
+        # Nobody knows where the cards of the shuffled hand are anymore
+        for opponent in self._opponents_of[name]:
+            known = opponent.view.opponents_hands[name]
+            known[:] = [None] * len(known)
+        logger.info(
+            "[GameMaster]: Player %s's hand has been shuffled.",
+            target_player.name,
+        )
 
-        elif effect == Card.Effect.SWAP:
-            target_name1, idx1, target_name2, idx2 = decision
-            target1 = self.get_player_by_name(target_name1)
-            target2 = self.get_player_by_name(target_name2)
-            # Swap the cards in the hands
-            card1 = self.hands[target1.name][idx1]
-            card2 = self.hands[target2.name][idx2]
-            self.hands[target1.name][idx1] = card2
-            self.hands[target2.name][idx2] = card1
-            # Update the views
-            for player in self.players:
-                if player == target1:
-                    tmp = player.view.hand[idx1]
-                    player.view.hand[idx1] = player.view.opponents_hands[target2.name][
-                        idx2
-                    ]
-                    player.view.opponents_hands[target2.name][idx2] = tmp
-                elif player == target2:
-                    tmp = player.view.hand[idx2]
-                    player.view.hand[idx2] = player.view.opponents_hands[target1.name][
-                        idx1
-                    ]
-                    player.view.opponents_hands[target1.name][idx1] = tmp
-                else:
-                    tmp = player.view.opponents_hands[target1.name][idx1]
-                    player.view.opponents_hands[target1.name][idx1] = (
-                        player.view.opponents_hands[target2.name][idx2]
-                    )
-                    player.view.opponents_hands[target2.name][idx2] = tmp
-            logger.info(
-                f"[GameMaster]: Player {target1.name}'s card at index {idx1} and Player {target2.name}'s card at index {idx2} swapped."
-            )
+    def _effect_swap(self, player: Player, decision: tuple[str, int, str, int]):
+        target_name1, idx1, target_name2, idx2 = decision
+        target1 = self.get_player_by_name(target_name1)
+        target2 = self.get_player_by_name(target_name2)
+        if target1 is target2 and idx1 == idx2:
+            return  # Swapping a card with itself changes nothing
+        # Swap the cards in the hands
+        hand1 = self.hands[target1.name]
+        hand2 = self.hands[target2.name]
+        hand1[idx1], hand2[idx2] = hand2[idx2], hand1[idx1]
+        # Update the views: each player swaps whatever they know about
+        # the two slots, wherever those slots live in their view.
+        for p in self.players:
+            view = p.view
+            known1 = view.hand if p is target1 else view.opponents_hands[target1.name]
+            known2 = view.hand if p is target2 else view.opponents_hands[target2.name]
+            known1[idx1], known2[idx2] = known2[idx2], known1[idx1]
+        logger.info(
+            "[GameMaster]: Player %s's card at index %s and Player %s's card at index %s swapped.",
+            target1.name,
+            idx1,
+            target2.name,
+            idx2,
+        )
 
-        elif effect == Card.Effect.PEEK:
-            target_name, idx = decision
-            target = self.get_player_by_name(target_name)
-            if target == player:
-                player.learn_card(idx, self.hands[target.name][idx])
-            else:
-                player.learn_opponent_card(target, idx, self.hands[target.name][idx])
-            logger.info(
-                f"[GameMaster]: Player {player.name} peeked at Player {target.name}'s card at index {idx}."
-            )
+    def _effect_peek(self, player: Player, decision: tuple[str, int]):
+        target_name, idx = decision
+        target = self.get_player_by_name(target_name)
+        if target is player:
+            player.learn_card(idx, self.hands[target.name][idx])
+        else:
+            player.learn_opponent_card(target, idx, self.hands[target.name][idx])
+        logger.info(
+            "[GameMaster]: Player %s peeked at Player %s's card at index %s.",
+            player.name,
+            target.name,
+            idx,
+        )
 
     def calculate_scores(self):
         """Implement the scoring logic based on the caller and hands."""
-        tmp_scores = [
-            sum(card.value() for card in self.hands[p.name]) for p in self.players
-        ]
-        scores = tmp_scores[:]
-        caller_score = tmp_scores.pop(self.view.caller_index)
-        min_opponent_score = min(tmp_scores)
+        caller_index = self.view.caller_index
+        hands = self.hands
+        scores = [sum(card._value for card in hands[p.name]) for p in self.players]
+        caller_score = scores[caller_index]
+        min_opponent_score = min(scores[:caller_index] + scores[caller_index + 1 :])
         if min_opponent_score > caller_score:
             logger.info(
-                f"[GameMaster]: Player {self.players[self.view.caller_index].name}'s call was a success!"
+                "[GameMaster]: Player %s's call was a success!",
+                self.players[caller_index].name,
             )
-            scores[self.view.caller_index] = 0
+            scores[caller_index] = 0
         else:
             logger.info(
-                f"[GameMaster]: Player {self.players[self.view.caller_index].name} failed the call."
+                "[GameMaster]: Player %s failed the call.",
+                self.players[caller_index].name,
             )
-            scores[self.view.caller_index] *= 2
-        for i, _ in enumerate(self.players):
-            self.view.scores[i] += scores[i]
+            scores[caller_index] *= 2
+        total_scores = self.view.scores
+        for i, score in enumerate(scores):
+            total_scores[i] += score
 
     def init_round(self):
-        logger.info(f"[GameMaster]: ## Starting round {self.view.round + 1} ##")
+        logger.info("[GameMaster]: ## Starting round %s ##", self.view.round + 1)
         self.dealer.reset_deck()
         self.dealer.deal_initial_hands(self.hands)
         # Player learn their initial hands
+        known_indices = self.initially_known
         for player in self.players:
             player.view.reset(self, player)
-            for i in self.initially_known:
-                player.learn_card(i, self.hands[player.name][i])
+            hand = self.hands[player.name]
+            for i in known_indices:
+                player.learn_card(i, hand[i])
         # Player with highest score starts
         self.current_player_index = (
             0 if self.view.round == 0 else self.view.scores.index(max(self.view.scores))
@@ -391,7 +483,7 @@ class Game:
         self.view.caller_index = -1
 
     def end_round(self):
-        logger.info(f"[GameMaster]: ## Ending round {self.view.round + 1} ##")
+        logger.info("[GameMaster]: ## Ending round %s ##", self.view.round + 1)
         self.view.round += 1
         self.calculate_scores()
 
@@ -402,11 +494,11 @@ class Game:
         logger.info("[GameMaster]: ## Game Over ##")
         logger.info("[GameMaster]: Final Scores:")
         for i, player in enumerate(self.players):
-            logger.info(f"\t{player.name}: {self.view.scores[i]} points")
+            logger.info("\t%s: %s points", player.name, self.view.scores[i])
         min_score = min(self.view.scores)
         winners = [
             p.name
             for i, p in enumerate(self.players)
             if self.view.scores[i] == min_score
         ]
-        logger.info("\n\tWinner(s): " + ", ".join(winners))
+        logger.info("\n\tWinner(s): %s", ", ".join(winners))
@@ -41,6 +41,8 @@ class Player:
                 for p in game.players
                 if p.name != player.name
             }
+            # Fixed for the whole game, so strategies need not rebuild it per decision
+            self.opponent_names: tuple[str, ...] = tuple(self.opponents_hands)
             self.treasure: list[Card | None] = [None] * game.dealer.treasure_size
 
         def reset(self, game: "Game", player: "Player"):
@@ -53,16 +55,29 @@ class Player:
             }
             self.treasure: list[Card | None] = [None] * game.dealer.treasure_size
 
+        def state_key(self) -> tuple:
+            """Return a hashable summary of what the player knows.
+
+            Combine it with Game.View.state_key() to memoize decisions.
+            """
+            return (
+                Card.encode((self.drawn_card,)),
+                Card.encode(self.hand),
+                tuple(Card.encode(hand) for hand in self.opponents_hands.values()),
+                Card.encode(self.treasure),
+            )
+
         def __repr__(self, indent: str = "") -> str:
 
             def format_cards(cards: list[Card | None]) -> str:
                 return f"[{', '.join(str(c) if c else '?' for c in cards)}]"
 
-            opponents_str = "{\n"
-            for name, hand in self.opponents_hands.items():
-                opponents_str += f"{indent}        '{name}': {format_cards(hand)},\n"
             if self.opponents_hands:
-                opponents_str = opponents_str.rstrip(",\n") + f"\n{indent}    }}"
+                opponents_lines = ",\n".join(
+                    f"{indent}        '{name}': {format_cards(hand)}"
+                    for name, hand in self.opponents_hands.items()
+                )
+                opponents_str = f"{{\n{opponents_lines}\n{indent}    }}"
             else:
                 opponents_str = "{}"
 
@@ -83,11 +98,6 @@ class Player:
         # creating all Player instances to avoid ordering problems.
         self.view: Player.View | None = None
 
-    def __eq__(self, value):
-        if not isinstance(value, Player):
-            return False
-        return self.name == value.name
-
     def init_view(self, game: "Game"):
         self.view = Player.View(game, self)
 
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Any, Optional
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from skibidi.card import Card
 from skibidi.dealer import Dealer
@@ -9,6 +10,27 @@ if TYPE_CHECKING:
     from skibidi.player import Player
 
 
+# Attributes printed when a view's repr fails
+_FALLBACK_ATTRS = (
+    "dealer_view",
+    "drawn_card",
+    "hand",
+    "opponents_hands",
+    "treasure",
+    "effects_queue",
+    "scores",
+    "round",
+)
+
+_get_name = attrgetter("name")
+
+# Accepted answers to the yes/no and draw-pile prompts
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+_DRAW = frozenset({"d", "draw"})
+_DISC = frozenset({"x", "discard", "dsc"})
+
+
 def _print_preface(label: str) -> None:
     """Print a preface for a prompt."""
     print(f"\n[HumanStrategy]: Player {label}, at your terminal!")
@@ -21,17 +43,7 @@ def _print_view(label: str, view: object) -> None:
         print(view)
     except Exception:
         # Fallback: print selected known attributes if repr fails
-        attrs = [
-            "dealer_view",
-            "drawn_card",
-            "hand",
-            "opponents_hands",
-            "treasure",
-            "effects_queue",
-            "scores",
-            "round",
-        ]
-        for a in attrs:
+        for a in _FALLBACK_ATTRS:
             if hasattr(view, a):
                 try:
                     print(f"{a}: {getattr(view, a)}")
@@ -47,11 +59,11 @@ def _choose_int(prompt: str, minv: int, maxv: int, allow_negative_one: bool = Tr
                     + (", or -1" if allow_negative_one else "") + "): ").strip()
         if allow_negative_one and val == "-1":
             return -1
-        try:
-            i = int(val)
-        except ValueError:
+        # Validate up front instead of catching int()'s ValueError
+        if not (val.isdecimal() or (val[:1] in ("-", "+") and val[1:].isdecimal())):
             print("[HumanStrategy]: Not an integer, try again.")
             continue
+        i = int(val)
         if i < minv or i > maxv:
             print("[HumanStrategy]: Out of range, try again.")
             continue
@@ -62,24 +74,109 @@ def _choose_player_name(prompt: str, candidates: Optional[list[str]]) -> Optiona
     """Prompt user to choose a player name from candidates or none (empty)."""
     if candidates:
         print(f"[HumanStrategy]: Available players: {', '.join(candidates)}")
+    cand_set = frozenset(candidates) if candidates is not None else None
     while True:
         val = input(f"[HumanStrategy]: {prompt} (enter player name or empty for 'None'): ").strip()
         if val == "":
             return None
         # If no candidates provided, accept any non-empty name
-        if candidates is None:
+        if cand_set is None:
             return val
 
-        if val in candidates:
+        if val in cand_set:
             return val
 
         # Offer to accept a free-text name if the user really wants it
         yn = input(f"[HumanStrategy]: '{val}' isn't in the known players. Accept this name anyway? (y/n): ").strip().lower()
-        if yn in ("y", "yes"):
+        if yn in _YES:
             return val
         print("[HumanStrategy]: Unknown player name, try again.")
 
 
+def _derive_candidates(public: "Game.View", private: "Player.View") -> Optional[list[str]]:
+    """Collect the names of the players an effect can target, or None if unknown."""
+    # Derive candidate player names from private.opponents_hands per README
+    candidates = None
+    if hasattr(private, "opponents_hands") and isinstance(private.opponents_hands, dict):
+        try:
+            names = getattr(private, "opponent_names", None)
+            if names is None:
+                names = tuple(private.opponents_hands)
+            candidates = list(names) + [private.name]
+        except Exception:
+            candidates = None
+
+    # Also include any player names that may be present in public.effects_queue
+    if candidates is None:
+        candidates = []
+    if hasattr(public, "effects_queue") and public.effects_queue:
+        # dict as an insertion-ordered set
+        seen = dict.fromkeys(candidates)
+        try:
+            for p, _ in public.effects_queue:
+                seen[_get_name(p)] = None
+        except (AttributeError, TypeError, ValueError):
+            # ignore if effects_queue doesn't contain Player objects
+            pass
+        candidates = list(seen)
+    return candidates or None
+
+
+def _prompt_target(
+    effect: Card.Effect, candidates: Optional[list[str]], hand_len_for: Callable[[str], int]
+) -> Optional[str]:
+    """Ask for the target player of a DRAW or SHUFFLE effect, or None."""
+    return _choose_player_name(
+        f"Effect {effect.value}: choose target player to apply effect to", candidates
+    )
+
+
+def _prompt_peek(
+    effect: Card.Effect, candidates: Optional[list[str]], hand_len_for: Callable[[str], int]
+) -> Optional[tuple[str, int]]:
+    """Ask for the player and card index to peek at, or None."""
+    target = _choose_player_name("Choose player to peek at", candidates)
+    if target is None:
+        print("[HumanStrategy]: Peek cancelled.")
+        return None
+    hand_len = hand_len_for(target)
+    if hand_len == 0:
+        print("[HumanStrategy]: No known card positions for that opponent; returning None.")
+        return None
+    idx = _choose_int(f"Index of card to peek in {target}'s hand", 0, hand_len - 1, allow_negative_one=False)
+    return (target, idx)
+
+
+def _prompt_swap(
+    effect: Card.Effect, candidates: Optional[list[str]], hand_len_for: Callable[[str], int]
+) -> Optional[tuple[str, int, str, int]]:
+    """Ask for the two players and card indices to swap, or None."""
+    p1 = _choose_player_name("First player to swap (player1)", candidates)
+    if p1 is None:
+        print("[HumanStrategy]: Swap cancelled.")
+        return None
+    p2 = _choose_player_name("Second player to swap (player2)", candidates)
+    if p2 is None:
+        print("[HumanStrategy]: Swap cancelled.")
+        return None
+    l1 = hand_len_for(p1)
+    l2 = hand_len_for(p2)
+    if l1 == 0 or l2 == 0:
+        print("[HumanStrategy]: One of the players has no known hand size; cancelling swap.")
+        return None
+    i1 = _choose_int(f"Index in {p1}'s hand to swap", 0, l1 - 1, allow_negative_one=False)
+    i2 = _choose_int(f"Index in {p2}'s hand to swap", 0, l2 - 1, allow_negative_one=False)
+    return (p1, i1, p2, i2)
+
+
+_EFFECT_PROMPTS = {
+    Card.Effect.DRAW: _prompt_target,
+    Card.Effect.SHUFFLE: _prompt_target,
+    Card.Effect.PEEK: _prompt_peek,
+    Card.Effect.SWAP: _prompt_swap,
+}
+
+
 class HumanStrategy(Strategy):
     """Interactive strategy that asks the human operator on stdin for each decision.
 
@@ -96,9 +193,9 @@ class HumanStrategy(Strategy):
         _print_view("Your private view", private)
         while True:
             choice = input("[HumanStrategy]: Choose draw pile - (D)RAW or (X)DISCARD: ").strip().lower()
-            if choice in ("d", "draw"):
+            if choice in _DRAW:
                 return Dealer.Source.DRAW
-            if choice in ("x", "discard", "dsc"):
+            if choice in _DISC:
                 return Dealer.Source.DISCARD
             print("[HumanStrategy]: Invalid choice, please enter 'draw' or 'discard' (or D/X).")
 
@@ -137,100 +234,37 @@ class HumanStrategy(Strategy):
             allow_negative_one=True,
         )
 
-    #TODO: rewrite this a bit more straightforwardly
     @staticmethod
     def decide_effect(public: "Game.View", private: "Player.View", effect: Card.Effect) -> Any:
         _print_preface(private.name)
         _print_view("Public view", public)
         _print_view("Your private view", private)
 
-        # Derive candidate player names from private.opponents_hands per README
-        candidates = None
-        if hasattr(private, "opponents_hands") and isinstance(private.opponents_hands, dict):
-            try:
-                candidates = list(private.opponents_hands.keys()) + [private.name]
-            except Exception:
-                candidates = None
-
-        # Also include any player names that may be present in public.effects_queue
-        if candidates is None:
-            candidates = []
-        if hasattr(public, "effects_queue") and public.effects_queue:
-            try:
-                for p, _ in public.effects_queue:
-                    name = getattr(p, "name", None)
-                    if name and name not in candidates:
-                        candidates.append(name)
-            except Exception:
-                # ignore if effects_queue doesn't contain Player objects
-                pass
-        if not candidates:
-            candidates = None
+        candidates = _derive_candidates(public, private)
 
-        if effect in (Card.Effect.DRAW, Card.Effect.SHUFFLE):
-            # Ask for target player or none
-            name = _choose_player_name(
-                f"Effect {effect.value}: choose target player to apply effect to", candidates
-            )
-            return name  # can be None
-
-        if effect is Card.Effect.PEEK:
-            # ask for player and index
-            target = _choose_player_name("Choose player to peek at", candidates)
-            if target is None:
-                print("[HumanStrategy]: Peek cancelled.")
-                return None
-            # try to get opponent hand length if available on public
-            opponent_hand_len = None
-            # Prefer private.opponents_hands info (known by this player)
-            if hasattr(private, "opponents_hands") and isinstance(private.opponents_hands, dict):
-                opponent_hand = private.opponents_hands.get(target)
-                if opponent_hand is not None:
-                    opponent_hand_len = len(opponent_hand)
+        # Hand sizes the player can rely on, looked up once for all branches
+        opp = getattr(private, "opponents_hands", None)
+        if not isinstance(opp, dict):
+            opp = None
+        pub_hands = getattr(public, "hands", None)
+        if not isinstance(pub_hands, dict):
+            pub_hands = None
+        own_hand_len = len(getattr(private, "hand", ()))
 
+        def _hand_len_for(name: str) -> int:
+            # Prefer private.opponents_hands info (known by this player)
+            if opp is not None and name in opp:
+                return len(opp[name])
             # Fallback to public.hands (if present) or to player's own hand length
-            if opponent_hand_len is None and hasattr(public, "hands") and isinstance(public.hands, dict):
-                opponent_hand_len = len(public.hands.get(target, []))
-
-            hand_len = opponent_hand_len if opponent_hand_len is not None else max(0, len(getattr(private, "hand", [])))
-            if hand_len == 0:
-                print("[HumanStrategy]: No known card positions for that opponent; returning None.")
-                return None
-            idx = _choose_int(f"Index of card to peek in {target}'s hand", 0, hand_len - 1, allow_negative_one=False)
-            return (target, idx)
-
-        if effect is Card.Effect.SWAP:
-            # ask for two players and two indices
-            p1 = _choose_player_name("First player to swap (player1)", candidates)
-            if p1 is None:
-                print("[HumanStrategy]: Swap cancelled.")
-                return None
-            p2 = _choose_player_name("Second player to swap (player2)", candidates)
-            if p2 is None:
-                print("[HumanStrategy]: Swap cancelled.")
-                return None
-            # best-effort to get lengths
-            def _hand_len_for(name: str) -> int:
-                # Prefer private.opponents_hands when available
-                if hasattr(private, "opponents_hands") and isinstance(private.opponents_hands, dict):
-                    h = private.opponents_hands.get(name)
-                    if h is not None:
-                        return len(h)
-                if hasattr(public, "hands") and isinstance(public.hands, dict):
-                    return len(public.hands.get(name, []))
-                return len(getattr(private, "hand", []))
-
-            l1 = _hand_len_for(p1)
-            l2 = _hand_len_for(p2)
-            if l1 == 0 or l2 == 0:
-                print("[HumanStrategy]: One of the players has no known hand size; cancelling swap.")
-                return None
-            i1 = _choose_int(f"Index in {p1}'s hand to swap", 0, l1 - 1, allow_negative_one=False)
-            i2 = _choose_int(f"Index in {p2}'s hand to swap", 0, l2 - 1, allow_negative_one=False)
-            return (p1, i1, p2, i2)
-
-        # NONE or unrecognized effects: return None
-        return None
+            if pub_hands is not None:
+                return len(pub_hands.get(name, ()))
+            return own_hand_len
+
+        prompt = _EFFECT_PROMPTS.get(effect)
+        if prompt is None:
+            # NONE or unrecognized effects: return None
+            return None
+        return prompt(effect, candidates, _hand_len_for)
 
     @staticmethod
     def decide_call(public: "Game.View", private: "Player.View") -> int:
@@ -242,9 +276,9 @@ class HumanStrategy(Strategy):
             # For one-card hand, ask yes/no; if yes return 0 (per convention)
             while True:
                 ans = input("[HumanStrategy]: Do you want to call the round end? (y/n): ").strip().lower()
-                if ans in ("y", "yes"):
+                if ans in _YES:
                     return 0
-                if ans in ("n", "no"):
+                if ans in _NO:
                     return -1
                 print("[HumanStrategy]: Please answer y or n.")
         # For larger hands ask for index or -1
@@ -1,5 +1,5 @@
 import random
-from typing import Any
+from typing import Any, Optional
 
 from skibidi.card import Card
 from skibidi.dealer import Dealer
@@ -7,17 +7,83 @@ from skibidi.game import Game
 from skibidi.player import Player
 from skibidi.strategy import Strategy
 
+# Bound once at import to save an attribute lookup per decision
+_random = random.random
+_randrange = random.randrange
+_getrandbits = random.getrandbits
+
+
+def _choose_target(public: Game.View, private: Player.View) -> str:
+    return random.choice(private.opponent_names)
+
+
+def _choose_peek(public: Game.View, private: Player.View) -> Optional[tuple[str, int]]:
+    if private.hand:
+        return (private.name, _randrange(len(private.hand)))
+    # Nothing left to peek at in hand, look at an opponent's card instead
+    names = tuple(name for name, hand in private.opponents_hands.items() if hand)
+    if not names:
+        return None
+    target = random.choice(names)
+    return (target, _randrange(len(private.opponents_hands[target])))
+
+
+def _choose_swap(public: Game.View, private: Player.View) -> Optional[tuple[str, int, str, int]]:
+    # Only hands that still hold cards can be swapped
+    hands = {name: hand for name, hand in private.opponents_hands.items() if hand}
+    if not hands and private.hand:
+        hands = {private.name: private.hand}
+    if not hands:
+        return None
+    names = tuple(hands)
+    target1 = random.choice(names)
+    target2 = random.choice(names)
+    idx1 = _randrange(len(hands[target1]))
+    idx2 = _randrange(len(hands[target2]))
+    return (target1, idx1, target2, idx2)
+
+
+def _no_decision(public: Game.View, private: Player.View) -> None:
+    return None
+
+
+_EFFECT_HANDLERS = {
+    Card.Effect.DRAW: _choose_target,
+    Card.Effect.SHUFFLE: _choose_target,
+    Card.Effect.PEEK: _choose_peek,
+    Card.Effect.SWAP: _choose_swap,
+    Card.Effect.NONE: _no_decision,
+}
+
 
 class RandomStrategy(Strategy):
     @staticmethod
     def select_draw_pile(public: Game.View, private: Player.View) -> Dealer.Source:
-        return random.choice([Dealer.Source.DRAW, Dealer.Source.DISCARD])
+        if not private.hand:
+            # A card taken from the discard pile must be kept, which needs a slot
+            return Dealer.Source.DRAW
+        return Dealer.Source.DRAW if _random() < 0.5 else Dealer.Source.DISCARD
+
+    @staticmethod
+    def select_draw_pile_batch(n: int) -> list[Dealer.Source]:
+        """Draw n independent select_draw_pile coin flips from one PRNG call.
+
+        Meant for rollouts that run many independent games side by side. It
+        ignores the views, so callers must handle empty hands themselves.
+        """
+        if n <= 0:
+            return []
+        bits = _getrandbits(n)
+        draw, discard = Dealer.Source.DRAW, Dealer.Source.DISCARD
+        return [draw if (bits >> i) & 1 else discard for i in range(n)]
 
     @staticmethod
     def select_card_to_exchange(
         public: Game.View, private: Player.View, source: Dealer.Source
     ) -> int:
-        return random.randint(0, len(private.hand) - 1)
+        if not private.hand:
+            return -1
+        return _randrange(len(private.hand))
 
     @staticmethod
     def select_card_to_discard(public: Game.View, private: Player.View) -> int:
@@ -26,41 +92,29 @@ class RandomStrategy(Strategy):
             if public.dealer_view.discard_pile
             else None
         )
-        ranks_in_hand = [card.rank for card in private.hand if card is not None]
-        if card_to_discard and card_to_discard.rank in ranks_in_hand:
-            try:
-                return private.hand.index(card_to_discard) if random.random() < 0.9 else -1
-            except ValueError:
-                return -1
-        return -1
+        if card_to_discard is None:
+            return -1
+        # First known index of each rank in hand
+        rank_to_idx = {}
+        for i, card in enumerate(private.hand):
+            if card is not None and card.rank not in rank_to_idx:
+                rank_to_idx[card.rank] = i
+        idx = rank_to_idx.get(card_to_discard.rank, -1)
+        return idx if idx != -1 and _random() < 0.9 else -1
 
     @staticmethod
     def decide_effect(
         public: Game.View, private: Player.View, effect: Card.Effect
     ) -> Any:
-        if effect == Card.Effect.SHUFFLE or effect == Card.Effect.DRAW:
-            return random.choice([name for name in private.opponents_hands.keys()])
-        elif effect == Card.Effect.PEEK:
-            return (private.name, random.randint(0, len(private.hand) - 1))
-        elif effect == Card.Effect.SWAP:
-            target1 = random.choice(
-                [name for name in private.opponents_hands.keys()]
-            )
-            target2 = random.choice(
-                [name for name in private.opponents_hands.keys()]
-            )
-            idx1 = random.randint(0, len(private.opponents_hands[target1]) - 1)
-            idx2 = random.randint(0, len(private.opponents_hands[target2]) - 1)
-            return (target1, idx1, target2, idx2)
-        elif effect == Card.Effect.NONE:
-            return None
-        else:
+        handler = _EFFECT_HANDLERS.get(effect)
+        if handler is None:
             raise ValueError(f"Unknown effect: {effect}")
+        return handler(public, private)
 
     @staticmethod
     def decide_call(public: Game.View, private: Player.View) -> int:
         # 5% chance to call
-        call = random.random() < 0.05
+        call = _random() < 0.05
         if call:
-            return random.randint(0, len(private.hand) - 1)
+            return _randrange(max(len(private.hand), 1))
         return -1
@@ -73,6 +73,7 @@ class Strategy:
             - For `Card.Effect.PEEK`: return a tuple **(target_player_name: str, card_index: int)**.
                 This indicates that the player wants to peek at the card at *card_index* in *target_player_name*'s hand.
             - *Optional*: For `Card.Effect.NONE`: return None.
+            - Return None for any effect to pass on it (e.g. when there is no valid target).
         """
         raise NotImplementedError("This method should be overridden by subclasses.")
 
@@ -87,6 +88,6 @@ class Strategy:
         Returns:
             int: The index of the card to discard, or -1 for no call.
 
-        **Note**: If only one card is in hand, call with some positive index (e.g. 0), even though this card will not be discarded.
+        **Note**: If only one card (or none) is in hand, call with index 0, even though no card will be discarded.
         """
         raise NotImplementedError("This method should be overridden by subclasses.")
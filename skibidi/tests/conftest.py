@@ -0,0 +1,81 @@
+"""Fixtures shared by the engine test modules."""
+
+import pytest
+
+from skibidi.card import Card
+from skibidi.dealer import Dealer
+from skibidi.game import Game
+from skibidi.strategy import Strategy
+
+
+class _StubStrategy(Strategy):
+    """No-op strategy for tests that never inspect strategy calls."""
+
+    @staticmethod
+    def select_draw_pile(public, private):
+        return Dealer.Source.DRAW
+
+    @staticmethod
+    def select_card_to_exchange(public, private, source):
+        return -1
+
+    @staticmethod
+    def select_card_to_discard(public, private):
+        return -1
+
+    @staticmethod
+    def decide_effect(public, private, effect):
+        return None
+
+    @staticmethod
+    def decide_call(public, private):
+        return -1
+
+
+_STUB_STRATEGY = _StubStrategy()
+
+
+@pytest.fixture(scope="session")
+def cards():
+    """Four distinct cards used to pre-populate hands (cards are immutable)."""
+    return (
+        Card.get(Card.Suit.HEARTS, Card.Rank.ACE),
+        Card.get(Card.Suit.SPADES, Card.Rank.TWO),
+        Card.get(Card.Suit.CLUBS, Card.Rank.THREE),
+        Card.get(Card.Suit.DIAMONDS, Card.Rank.FOUR),
+    )
+
+
+@pytest.fixture(scope="session")
+def two_player_names():
+    """Names of the players in two-player fixtures."""
+    return ("P1", "P2")
+
+
+@pytest.fixture
+def game(two_player_names, cards):
+    """A two-player Game with stub strategies and pre-populated hands.
+
+    Built from scratch for each test: constructing a Game is several times
+    cheaper than deep-copying a shared template.
+    """
+    game = Game(n_players=2, names=list(two_player_names), hand_size=2, treasure_size=1)
+
+    for player in game.players:
+        player.strategy = _STUB_STRATEGY
+
+    # Pre-populate hands for testing
+    name1, name2 = two_player_names
+    card1, card2, card3, card4 = cards
+    game.hands[name1] = [card1, card2]
+    game.hands[name2] = [card3, card4]
+
+    # Initialize player views to match hand sizes
+    for p in game.players:
+        p.view.hand = [None] * len(game.hands[p.name])
+        p.view.opponents_hands = {
+            op.name: [None] * len(game.hands[op.name])
+            for op in game.players
+            if op is not p
+        }
+    return game
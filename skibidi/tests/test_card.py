@@ -1,103 +1,118 @@
-import unittest
+import pytest
 
 from skibidi.card import Card
 
 
-class TestCard(unittest.TestCase):
-    """Binary test suite for the Card class."""
-
-    def test_card_creation_and_attributes(self):
-        """Tests that a standard card is created with the correct suit, rank, and effect."""
-        card = Card(Card.Suit.SPADES, Card.Rank.ACE)
-        self.assertEqual(card.suit, Card.Suit.SPADES)
-        self.assertEqual(card.rank, Card.Rank.ACE)
-        self.assertEqual(card.effect, Card.Effect.NONE, "Aces should have no effect.")
-
-    def test_joker_creation(self):
-        """Tests that a Joker is created correctly, with no suit."""
-        joker = Card(None, Card.Rank.JOKER_RED)
-        self.assertIsNone(joker.suit, "Jokers should have no suit.")
-        self.assertEqual(joker.rank, Card.Rank.JOKER_RED)
-        self.assertEqual(
-            joker.effect, Card.Effect.NONE, "Jokers should have no effect."
-        )
-
-    def test_card_representation(self):
-        """Tests the __repr__ method for both standard cards and Jokers."""
-        card_10h = Card(Card.Suit.HEARTS, Card.Rank.TEN)
-        self.assertEqual(repr(card_10h), "10♥")
-
-        joker_b = Card(None, Card.Rank.JOKER_BLACK)
-        self.assertEqual(repr(joker_b), "JOKER_BLACK")
-
-    def test_card_equality(self):
-        """Tests the __eq__ method for equality and inequality."""
-        card1 = Card(Card.Suit.CLUBS, Card.Rank.FIVE)
-        card2 = Card(Card.Suit.CLUBS, Card.Rank.FIVE)
-        card3 = Card(Card.Suit.DIAMONDS, Card.Rank.FIVE)
-        card4 = Card(Card.Suit.CLUBS, Card.Rank.SIX)
-        joker1 = Card(None, Card.Rank.JOKER_RED)
-        joker2 = Card(None, Card.Rank.JOKER_RED)
-
-        self.assertEqual(card1, card2, "Identical cards should be equal.")
-        self.assertNotEqual(
-            card1, card3, "Cards with different suits should not be equal."
-        )
-        self.assertNotEqual(
-            card1, card4, "Cards with different ranks should not be equal."
-        )
-        self.assertEqual(joker1, joker2, "Identical jokers should be equal.")
-        self.assertNotEqual(
-            card1, joker1, "A standard card should not be equal to a Joker."
-        )
-        self.assertNotEqual(card1, "5♣", "A card should not be equal to a string.")
-
-    def test_card_value(self):
-        """Tests the value() method for all card types."""
-        self.assertEqual(Card(Card.Suit.HEARTS, Card.Rank.SEVEN).value(), 7)
-        self.assertEqual(Card(Card.Suit.HEARTS, Card.Rank.ACE).value(), 1)
-        self.assertEqual(Card(Card.Suit.HEARTS, Card.Rank.KING).value(), 10)
-        self.assertEqual(Card(Card.Suit.HEARTS, Card.Rank.QUEEN).value(), 10)
-        self.assertEqual(Card(Card.Suit.HEARTS, Card.Rank.JACK).value(), 10)
-        self.assertEqual(Card(None, Card.Rank.JOKER_RED).value(), 0)
-
-    def test_card_effects(self):
-        """Tests that the correct effect is assigned based on rank and suit."""
-        # King effects
-        king_h = Card(Card.Suit.HEARTS, Card.Rank.KING)
-        self.assertEqual(
-            king_h.effect, Card.Effect.SHUFFLE, "Red Kings should have SHUFFLE effect."
-        )
-        king_d = Card(Card.Suit.DIAMONDS, Card.Rank.KING)
-        self.assertEqual(
-            king_d.effect, Card.Effect.SHUFFLE, "Red Kings should have SHUFFLE effect."
-        )
-        king_s = Card(Card.Suit.SPADES, Card.Rank.KING)
-        self.assertEqual(
-            king_s.effect, Card.Effect.DRAW, "Black Kings should have DRAW effect."
-        )
-        king_c = Card(Card.Suit.CLUBS, Card.Rank.KING)
-        self.assertEqual(
-            king_c.effect, Card.Effect.DRAW, "Black Kings should have DRAW effect."
-        )
-
-        # Queen and Jack effects
-        queen = Card(Card.Suit.SPADES, Card.Rank.QUEEN)
-        self.assertEqual(
-            queen.effect, Card.Effect.SWAP, "Queens should have SWAP effect."
-        )
-        jack = Card(Card.Suit.SPADES, Card.Rank.JACK)
-        self.assertEqual(
-            jack.effect, Card.Effect.PEEK, "Jacks should have PEEK effect."
-        )
-
-        # No effect
-        seven = Card(Card.Suit.SPADES, Card.Rank.SEVEN)
-        self.assertEqual(
-            seven.effect, Card.Effect.NONE, "Numeric cards should have no effect."
-        )
-
-
-if __name__ == "__main__":
-    # This allows the script to be run directly from the command line
-    unittest.main()
+def test_card_creation_and_attributes():
+    """Tests that a standard card is created with the correct suit, rank, and effect."""
+    card = Card(Card.Suit.SPADES, Card.Rank.ACE)
+    assert card.suit == Card.Suit.SPADES
+    assert card.rank == Card.Rank.ACE
+    assert card.effect == Card.Effect.NONE, "Aces should have no effect."
+
+
+def test_joker_creation():
+    """Tests that a Joker is created correctly, with no suit."""
+    joker = Card(None, Card.Rank.JOKER_RED)
+    assert joker.suit is None, "Jokers should have no suit."
+    assert joker.rank == Card.Rank.JOKER_RED
+    assert joker.effect == Card.Effect.NONE, "Jokers should have no effect."
+
+
+def test_invalid_card_rejected():
+    """Tests that only the 54 cards of the deck can be created."""
+    with pytest.raises(ValueError, match="Invalid card"):
+        Card(Card.Suit.HEARTS, Card.Rank.JOKER_RED)
+    with pytest.raises(ValueError, match="Invalid card"):
+        Card(None, Card.Rank.ACE)
+
+
+def test_card_representation():
+    """Tests the __repr__ method for both standard cards and Jokers."""
+    card_10h = Card(Card.Suit.HEARTS, Card.Rank.TEN)
+    assert repr(card_10h) == "10♥"
+
+    joker_b = Card(None, Card.Rank.JOKER_BLACK)
+    assert repr(joker_b) == "★Black Joker★"
+
+    joker_r = Card(None, Card.Rank.JOKER_RED)
+    assert repr(joker_r) == "★Red Joker★"
+
+
+def test_card_equality():
+    """Tests the __eq__ method for equality and inequality."""
+    card1 = Card(Card.Suit.CLUBS, Card.Rank.FIVE)
+    card2 = Card(Card.Suit.CLUBS, Card.Rank.FIVE)
+    card3 = Card(Card.Suit.DIAMONDS, Card.Rank.FIVE)
+    card4 = Card(Card.Suit.CLUBS, Card.Rank.SIX)
+    joker1 = Card(None, Card.Rank.JOKER_RED)
+    joker2 = Card(None, Card.Rank.JOKER_RED)
+
+    assert card1 == card2, "Identical cards should be equal."
+    assert card1 != card3, "Cards with different suits should not be equal."
+    assert card1 != card4, "Cards with different ranks should not be equal."
+    assert joker1 == joker2, "Identical jokers should be equal."
+    assert card1 != joker1, "A standard card should not be equal to a Joker."
+    assert card1 != "5♣", "A card should not be equal to a string."
+
+
+def test_card_get_returns_shared_instance():
+    """Tests that Card.get returns one shared instance per (suit, rank)."""
+    card1 = Card.get(Card.Suit.CLUBS, Card.Rank.FIVE)
+    card2 = Card.get(Card.Suit.CLUBS, Card.Rank.FIVE)
+    assert card1 is card2
+    assert card1 == Card(Card.Suit.CLUBS, Card.Rank.FIVE)
+    assert hash(card1) == hash(
+        Card(Card.Suit.CLUBS, Card.Rank.FIVE)
+    ), "Equal cards should have equal hashes."
+    assert Card.get(None, Card.Rank.JOKER_BLACK) is Card.get(None, Card.Rank.JOKER_BLACK)
+
+
+def test_card_index():
+    """Tests that each card of the deck has a distinct, stable id."""
+    ids = {
+        Card.get(suit, rank)._index
+        for suit in Card.Suit
+        for rank in Card.Rank
+        if rank not in [Card.Rank.JOKER_RED, Card.Rank.JOKER_BLACK]
+    }
+    ids |= {
+        Card.get(None, Card.Rank.JOKER_RED)._index,
+        Card.get(None, Card.Rank.JOKER_BLACK)._index,
+    }
+    assert ids == set(range(54))
+    card = Card(Card.Suit.DIAMONDS, Card.Rank.QUEEN)
+    assert Card.from_index(card._index) is Card.get(card.suit, card.rank)
+
+
+def test_card_value():
+    """Tests the value() method for all card types."""
+    assert Card(Card.Suit.HEARTS, Card.Rank.SEVEN).value() == 7
+    assert Card(Card.Suit.HEARTS, Card.Rank.ACE).value() == 1
+    assert Card(Card.Suit.HEARTS, Card.Rank.KING).value() == 10
+    assert Card(Card.Suit.HEARTS, Card.Rank.QUEEN).value() == 10
+    assert Card(Card.Suit.HEARTS, Card.Rank.JACK).value() == 10
+    assert Card(None, Card.Rank.JOKER_RED).value() == 0
+
+
+def test_card_effects():
+    """Tests that the correct effect is assigned based on rank and suit."""
+    # King effects
+    king_h = Card(Card.Suit.HEARTS, Card.Rank.KING)
+    assert king_h.effect == Card.Effect.SHUFFLE, "Red Kings should have SHUFFLE effect."
+    king_d = Card(Card.Suit.DIAMONDS, Card.Rank.KING)
+    assert king_d.effect == Card.Effect.SHUFFLE, "Red Kings should have SHUFFLE effect."
+    king_s = Card(Card.Suit.SPADES, Card.Rank.KING)
+    assert king_s.effect == Card.Effect.DRAW, "Black Kings should have DRAW effect."
+    king_c = Card(Card.Suit.CLUBS, Card.Rank.KING)
+    assert king_c.effect == Card.Effect.DRAW, "Black Kings should have DRAW effect."
+
+    # Queen and Jack effects
+    queen = Card(Card.Suit.SPADES, Card.Rank.QUEEN)
+    assert queen.effect == Card.Effect.SWAP, "Queens should have SWAP effect."
+    jack = Card(Card.Suit.SPADES, Card.Rank.JACK)
+    assert jack.effect == Card.Effect.PEEK, "Jacks should have PEEK effect."
+
+    # No effect
+    seven = Card(Card.Suit.SPADES, Card.Rank.SEVEN)
+    assert seven.effect == Card.Effect.NONE, "Numeric cards should have no effect."
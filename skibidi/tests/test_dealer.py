@@ -1,160 +1,208 @@
-import unittest
+import copy
+import random
+from collections import Counter
+
+import pytest
 
 from skibidi.card import Card
 from skibidi.dealer import Dealer
 
+HAND_SIZE = 5
+TREASURE_SIZE = 3
+N_PLAYERS = 4
+
+
+@pytest.fixture(scope="session")
+def _dealer_template():
+    """A dealer built once and only ever copied from."""
+    return Dealer(hand_size=HAND_SIZE, treasure_size=TREASURE_SIZE)
+
+
+@pytest.fixture
+def dealer(_dealer_template):
+    """A fresh dealer for each test, copied from the template."""
+    dealer = copy.copy(_dealer_template)
+    # Give the copy its own generator, piles and view so that tests never
+    # mutate the template; the generator is seeded to keep draws deterministic
+    dealer._rng = random.Random(0)
+    dealer.deck = list(_dealer_template.deck)
+    dealer.draw_pile = list(_dealer_template.deck)
+    dealer.discard_pile = []
+    dealer.treasure = []
+    dealer.view = Dealer.View(dealer)
+    return dealer
+
+
+def _pile_sizes(dealer):
+    """Sizes of the deck, draw pile, discard pile and treasure."""
+    return (
+        len(dealer.deck),
+        len(dealer.draw_pile),
+        len(dealer.discard_pile),
+        len(dealer.treasure),
+    )
+
+
+def test_initialization(dealer):
+    """Test that the dealer initializes with the correct state."""
+    # Full deck and draw pile, empty discard pile and treasure
+    assert _pile_sizes(dealer) == (54, 54, 0, 0)
+    assert dealer.view.draw_pile_size == 54
+    assert dealer.view.discard_pile is dealer.discard_pile
+
+
+def test_reset_deck(dealer):
+    """Test that resetting the deck restores all piles."""
+    # Modify the state
+    dealer.draw_pile = dealer.draw_pile[:10]
+    dealer.discard_pile.append(Card.get(Card.Suit.SPADES, Card.Rank.ACE))
+
+    dealer.reset_deck()
+
+    assert _pile_sizes(dealer) == (54, 54, 0, 0)
+
+    # The draw pile holds the full deck again (it is shuffled lazily on draw)
+    assert Counter(dealer.draw_pile) == Counter(dealer.deck)
+    assert dealer.view.draw_pile_size == 54
+
+
+def test_draws_are_shuffled(dealer):
+    """Test that successive draws do not follow the draw pile order."""
+    dealer.reset_deck()
+    drawn = [dealer.draw_from_draw() for _ in range(10)]
+    # Drawing in pile order would return the last 10 cards of the deck
+    # reversed (highly unlikely to happen with a lazy shuffle)
+    assert drawn != dealer.deck[::-1][:10]
+
+
+def test_seeded_dealers_are_reproducible():
+    """Test that dealers sharing a seed deal identical cards."""
+    dealer1 = Dealer(rng=random.Random(42))
+    dealer2 = Dealer(rng=random.Random(42))
+    hands1 = {"P1": [], "P2": []}
+    hands2 = {"P1": [], "P2": []}
+    dealer1.deal_initial_hands(hands1)
+    dealer2.deal_initial_hands(hands2)
+    assert hands1 == hands2
+    assert dealer1.draw_from_draw() == dealer2.draw_from_draw()
+
+
+def test_deal_initial_hands(dealer):
+    """Test the initial dealing of cards to players."""
+    player_names = [f"Player {i+1}" for i in range(N_PLAYERS)]
+    hands = {name: [] for name in player_names}
+
+    dealer.deal_initial_hands(hands)
+
+    assert [len(hand) for hand in hands.values()] == [HAND_SIZE] * N_PLAYERS
+
+    # One card is turned up on the discard pile, the rest stays to draw
+    expected_draw_pile_size = 54 - (N_PLAYERS * HAND_SIZE) - TREASURE_SIZE - 1
+    assert _pile_sizes(dealer) == (54, expected_draw_pile_size, 1, TREASURE_SIZE)
+    assert dealer.view.draw_pile_size == expected_draw_pile_size
+
+
+def test_deal_replaces_previous_hands(dealer):
+    """Test that dealing a new round does not extend the previous hands."""
+    hands = {"P1": [], "P2": []}
+    dealer.deal_initial_hands(hands)
+    dealer.reset_deck()
+    dealer.deal_initial_hands(hands)
+
+    for hand in hands.values():
+        assert len(hand) == HAND_SIZE
+
+
+def test_deal_not_enough_cards(dealer):
+    """Test that dealing fails if there are not enough cards."""
+    # Create a scenario with too many players for the deck size
+    too_many_players = 20
+    player_names = [f"Player {i+1}" for i in range(too_many_players)]
+    hands = {name: [] for name in player_names}
+
+    with pytest.raises(ValueError, match="Not enough cards"):
+        dealer.deal_initial_hands(hands)
+
+
+def test_reshuffle_discard_into_draw(dealer):
+    """Test reshuffling the discard pile back into the draw pile."""
+    dealer.draw_pile = []
+    dealer.discard_pile = [
+        Card.get(Card.Suit.SPADES, Card.Rank.TWO),
+        Card.get(Card.Suit.HEARTS, Card.Rank.THREE),
+        Card.get(Card.Suit.CLUBS, Card.Rank.FOUR),  # This will be the top card
+    ]
+
+    dealer.reshuffle_discard_into_draw()
+
+    # The new draw pile should contain the bottom 2 cards
+    assert len(dealer.draw_pile) == 2
+    # The discard pile should only contain the previous top card
+    assert len(dealer.discard_pile) == 1
+    assert dealer.discard_pile[0].rank == Card.Rank.FOUR
+    # The view reads the dealer lazily and must reflect the new piles
+    assert dealer.view.draw_pile_size == 2
+    assert dealer.view.discard_pile is dealer.discard_pile
+
+
+def test_draw_from_draw_pile(dealer):
+    """Test drawing a card from the draw pile."""
+    initial_size = len(dealer.draw_pile)
+    card = dealer.draw_from_draw()
+
+    assert isinstance(card, Card)
+    assert len(dealer.draw_pile) == initial_size - 1
+    assert dealer.view.draw_pile_size == initial_size - 1
+
+
+def test_draw_from_empty_draw_pile_with_reshuffle(dealer):
+    """Test that drawing from an empty draw pile triggers a reshuffle."""
+    dealer.draw_pile = []
+    dealer.discard_pile = [
+        Card.get(Card.Suit.SPADES, Card.Rank.ACE),
+        Card.get(Card.Suit.HEARTS, Card.Rank.KING),
+    ]
+
+    card = dealer.draw_from_draw()
+
+    assert card is not None
+    # Only one card was available to be moved to draw pile
+    assert len(dealer.draw_pile) == 0
+    assert len(dealer.discard_pile) == 1
+
+
+@pytest.mark.parametrize(
+    "draw, match",
+    [
+        (Dealer.draw_from_draw, "Deck is empty"),
+        (Dealer.draw_from_discard, "Discard pile is empty"),
+    ],
+    ids=["draw", "discard"],
+)
+def test_draw_from_empty_piles(dealer, draw, match):
+    """Test that drawing fails when there is nothing left to draw."""
+    dealer.draw_pile = []
+    dealer.discard_pile = []
+
+    with pytest.raises(ValueError, match=match):
+        draw(dealer)
+
+
+def test_draw_from_discard(dealer):
+    """Test drawing a card from the discard pile."""
+    top_card = Card.get(Card.Suit.DIAMONDS, Card.Rank.JACK)
+    dealer.discard_pile.append(top_card)
+
+    card = dealer.draw_from_discard()
+
+    assert card == top_card
+    assert len(dealer.discard_pile) == 0
+
+
+def test_discard(dealer):
+    """Test that discarding adds a card to the discard pile."""
+    card_to_discard = Card.get(Card.Suit.SPADES, Card.Rank.TEN)
+    dealer.discard(card_to_discard)
 
-class TestDealer(unittest.TestCase):
-    """Unit test suite for the Dealer class."""
-
-    def setUp(self):
-        """Set up a new game and dealer for each test."""
-        self.hand_size = 5
-        self.treasure_size = 3
-        self.n_players = 4
-        self.dealer = Dealer(hand_size=self.hand_size, treasure_size=self.treasure_size)
-
-    def test_initialization(self):
-        """Test that the dealer initializes with the correct state."""
-        self.assertEqual(len(self.dealer.deck), 54, "Deck should have 54 cards.")
-        self.assertEqual(
-            len(self.dealer.draw_pile), 54, "Draw pile should start with 54 cards."
-        )
-        self.assertEqual(
-            len(self.dealer.discard_pile), 0, "Discard pile should be initially empty."
-        )
-        self.assertEqual(
-            len(self.dealer.treasure), 0, "Treasure should be initially empty."
-        )
-        self.assertEqual(self.dealer.view.draw_pile_size, 54)
-        self.assertIs(self.dealer.view.discard_pile, self.dealer.discard_pile)
-
-    def test_reset_deck(self):
-        """Test that resetting the deck shuffles and resets all piles."""
-        # Modify the state
-        self.dealer.draw_pile = self.dealer.draw_pile[:10]
-        self.dealer.discard_pile.append(Card(Card.Suit.SPADES, Card.Rank.ACE))
-
-        # Keep a copy of the draw pile before reset to check for shuffling
-        original_draw_pile_order = self.dealer.draw_pile[:]
-
-        self.dealer.reset_deck()
-
-        self.assertEqual(len(self.dealer.draw_pile), 54)
-        self.assertEqual(len(self.dealer.discard_pile), 0)
-        self.assertEqual(len(self.dealer.treasure), 0)
-
-        # Check that the deck is actually shuffled (highly likely to be different)
-        self.assertNotEqual(self.dealer.draw_pile, original_draw_pile_order)
-        self.assertEqual(self.dealer.view.draw_pile_size, 54)
-
-    def test_deal_initial_hands(self):
-        """Test the initial dealing of cards to players."""
-        player_names = [f"Player {i+1}" for i in range(self.n_players)]
-        hands = {name: [] for name in player_names}
-
-        self.dealer.deal_initial_hands(hands)
-
-        # Check hand sizes
-        for name in player_names:
-            self.assertEqual(len(hands[name]), self.hand_size)
-
-        # Check treasure size
-        self.assertEqual(len(self.dealer.treasure), self.treasure_size)
-
-        # Check discard pile
-        self.assertEqual(len(self.dealer.discard_pile), 1)
-
-        # Check remaining draw pile size
-        expected_draw_pile_size = (
-            54 - (self.n_players * self.hand_size) - self.treasure_size - 1
-        )
-        self.assertEqual(len(self.dealer.draw_pile), expected_draw_pile_size)
-        self.assertEqual(self.dealer.view.draw_pile_size, expected_draw_pile_size)
-
-    def test_deal_not_enough_cards(self):
-        """Test that dealing fails if there are not enough cards."""
-        # Create a scenario with too many players for the deck size
-        too_many_players = 20
-        player_names = [f"Player {i+1}" for i in range(too_many_players)]
-        hands = {name: [] for name in player_names}
-
-        with self.assertRaises(ValueError):
-            self.dealer.deal_initial_hands(hands)
-
-    def test_reshuffle_discard_into_draw(self):
-        """Test reshuffling the discard pile back into the draw pile."""
-        self.dealer.draw_pile = []
-        self.dealer.discard_pile = [
-            Card(Card.Suit.SPADES, Card.Rank.TWO),
-            Card(Card.Suit.HEARTS, Card.Rank.THREE),
-            Card(Card.Suit.CLUBS, Card.Rank.FOUR),  # This will be the top card
-        ]
-
-        self.dealer.reshuffle_discard_into_draw()
-
-        # The new draw pile should contain the bottom 2 cards
-        self.assertEqual(len(self.dealer.draw_pile), 2)
-        # The discard pile should only contain the previous top card
-        self.assertEqual(len(self.dealer.discard_pile), 1)
-        self.assertEqual(self.dealer.discard_pile[0].rank, Card.Rank.FOUR)
-
-    def test_draw_from_draw_pile(self):
-        """Test drawing a card from the draw pile."""
-        initial_size = len(self.dealer.draw_pile)
-        card = self.dealer.draw_from_draw()
-
-        self.assertIsInstance(card, Card)
-        self.assertEqual(len(self.dealer.draw_pile), initial_size - 1)
-        self.assertEqual(self.dealer.view.draw_pile_size, initial_size - 1)
-
-    def test_draw_from_empty_draw_pile_with_reshuffle(self):
-        """Test that drawing from an empty draw pile triggers a reshuffle."""
-        self.dealer.draw_pile = []
-        self.dealer.discard_pile = [
-            Card(Card.Suit.SPADES, Card.Rank.ACE),
-            Card(Card.Suit.HEARTS, Card.Rank.KING),
-        ]
-
-        card = self.dealer.draw_from_draw()
-
-        self.assertIsNotNone(card)
-        self.assertEqual(
-            len(self.dealer.draw_pile), 0
-        )  # Only one card was available to be moved to draw pile
-        self.assertEqual(len(self.dealer.discard_pile), 1)
-
-    def test_draw_from_completely_empty_deck(self):
-        """Test that drawing fails when both piles are empty."""
-        self.dealer.draw_pile = []
-        self.dealer.discard_pile = []
-
-        with self.assertRaises(ValueError):
-            self.dealer.draw_from_draw()
-
-    def test_draw_from_discard(self):
-        """Test drawing a card from the discard pile."""
-        top_card = Card(Card.Suit.DIAMONDS, Card.Rank.JACK)
-        self.dealer.discard_pile.append(top_card)
-
-        card = self.dealer.draw_from_discard()
-
-        self.assertEqual(card, top_card)
-        self.assertEqual(len(self.dealer.discard_pile), 0)
-
-    def test_draw_from_empty_discard(self):
-        """Test that drawing from an empty discard pile fails."""
-        with self.assertRaises(ValueError):
-            self.dealer.draw_from_discard()
-
-    def test_discard(self):
-        """Test that discarding adds a card to the discard pile."""
-        card_to_discard = Card(Card.Suit.SPADES, Card.Rank.TEN)
-        self.dealer.discard(card_to_discard)
-
-        self.assertEqual(len(self.dealer.discard_pile), 1)
-        self.assertEqual(self.dealer.discard_pile[0], card_to_discard)
-
-
-if __name__ == "__main__":
-    unittest.main()
+    assert len(dealer.discard_pile) == 1
+    assert dealer.discard_pile[0] == card_to_discard
@@ -1,18 +1,42 @@
-import importlib
-import inspect
-import pkgutil
-import unittest
+import functools
+
+import pytest
 
 from skibidi.card import Card
 from skibidi.dealer import Dealer
-from skibidi.strategy.strategy import Strategy
+from skibidi.strategy.random import RandomStrategy
+
+REQUIRED_METHODS = (
+    "select_draw_pile",
+    "select_card_to_exchange",
+    "select_card_to_discard",
+    "decide_effect",
+    "decide_call",
+)
+
+# Cards are immutable, so the sample hand can be shared across tests
+_SAMPLE_HAND = (
+    Card.get(Card.Suit.CLUBS, Card.Rank.TWO),
+    Card.get(Card.Suit.SPADES, Card.Rank.THREE),
+)
+_EFFECTS = tuple(Card.Effect)
+_VALID_SOURCES = frozenset({Dealer.Source.DRAW, Dealer.Source.DISCARD})
+# Expected decide_effect results: (player1, index1, player2, index2) and (player, index)
+_SWAP_SCHEMA = (str, int, str, int)
+_PEEK_SCHEMA = (str, int)
+
+
+@functools.lru_cache(maxsize=None)
+def _unknown_hand(size: int) -> tuple[None, ...]:
+    """Template for a hand of `size` unknown cards."""
+    return (None,) * size
 
 
 # Minimal fake views used to call strategy methods
 class _FakeDealerView:
     def __init__(self):
         self.discard_pile = []
-        self.draw_pile = [Card(Card.Suit.HEARTS, Card.Rank.ACE)]
+        self.draw_pile = [Card.get(Card.Suit.HEARTS, Card.Rank.ACE)]
 
 
 class _FakePublicView:
@@ -32,152 +56,231 @@ class _FakePrivateView:
         # strategies that may reference private.name and then index into
         # private.opponents_hands[private.name]. This mirrors the minimal
         # information a player's view might provide.
-        self.opponents_hands = {"P2": [None] * len(hand), self.name: [None] * len(hand)}
-
-
-class TestStrategyImplementations(unittest.TestCase):
-    """Discover strategy implementations and validate their API / return conventions."""
-
-    def test_all_strategies_conform(self):
-        # import the package and iterate modules
-        pkg = importlib.import_module("skibidi.strategy")
-        package_path = pkg.__path__  # type: ignore
-
-        # create sample views for calls
-        sample_hand = [
-            Card(Card.Suit.CLUBS, Card.Rank.TWO),
-            Card(Card.Suit.SPADES, Card.Rank.THREE),
-        ]
-        public = _FakePublicView()
-        private = _FakePrivateView(sample_hand)
-
-        # iterate all modules inside skibidi.strategy package
-        for finder, name, ispkg in pkgutil.iter_modules(package_path):
-            # Skip package internals and the abstract base module
-            if name == "strategy" or name.startswith("__"):
-                continue
-            # Exclude the interactive human strategy from automated checks
-            if name == "human":
-                continue
-            module_name = f"skibidi.strategy.{name}"
-            module = importlib.import_module(module_name)
-
-            # find all Strategy subclasses in module
-            for _, cls in inspect.getmembers(module, inspect.isclass):
-                # Skip the interactive HumanStrategy class (requires stdin)
-                if cls.__name__ == "HumanStrategy":
-                    continue
-                if not issubclass(cls, Strategy) or cls is Strategy:
-                    continue
-
-                with self.subTest(strategy=cls.__name__):
-                    # ensure required callables are present
-                    for method in (
-                        "select_draw_pile",
-                        "select_card_to_exchange",
-                        "select_card_to_discard",
-                        "decide_effect",
-                        "decide_call",
-                    ):
-                        self.assertTrue(
-                            hasattr(cls, method),
-                            msg=f"{cls.__name__} missing required method: {method}",
-                        )
-
-                    # Call select_draw_pile and expect a Dealer.Source enum
-                    try:
-                        src = getattr(cls, "select_draw_pile")(public, private)
-                    except NotImplementedError:
-                        self.fail(f"{cls.__name__}.select_draw_pile not implemented")
-                    self.assertIn(
-                        src,
-                        (Dealer.Source.DRAW, Dealer.Source.DISCARD),
-                        msg=f"{cls.__name__}.select_draw_pile returned invalid value: {src}",
-                    )
-
-                    # Call select_card_to_exchange -> int in [-1, len(hand)-1]
-                    try:
-                        idx = getattr(cls, "select_card_to_exchange")(
-                            public, private, Dealer.Source.DRAW
-                        )
-                    except NotImplementedError:
-                        self.fail(
-                            f"{cls.__name__}.select_card_to_exchange not implemented"
-                        )
-                    self.assertIsInstance(idx, int)
-                    self.assertGreaterEqual(
-                        idx, -1, msg=f"{cls.__name__}.select_card_to_exchange < -1"
-                    )
-                    self.assertLessEqual(
-                        idx,
-                        len(private.hand) - 1,
-                        msg=f"{cls.__name__}.select_card_to_exchange >= hand size",
-                    )
-
-                    # Call select_card_to_discard -> int in [-1, len(hand)-1]
-                    try:
-                        didx = getattr(cls, "select_card_to_discard")(public, private)
-                    except NotImplementedError:
-                        self.fail(
-                            f"{cls.__name__}.select_card_to_discard not implemented"
-                        )
-                    self.assertIsInstance(didx, int)
-                    self.assertGreaterEqual(
-                        didx, -1, msg=f"{cls.__name__}.select_card_to_discard < -1"
-                    )
-                    self.assertLessEqual(
-                        didx,
-                        len(private.hand) - 1,
-                        msg=f"{cls.__name__}.select_card_to_discard >= hand size",
-                    )
-
-                    # decide_effect: exercise each Card.Effect and validate return type follows conventions
-                    for effect in Card.Effect:
-                        try:
-                            res = getattr(cls, "decide_effect")(public, private, effect)
-                        except NotImplementedError:
-                            self.fail(f"{cls.__name__}.decide_effect not implemented")
-                        # For DRAW/SHUFFLE expect either None or a player-name string
-                        if effect in (Card.Effect.DRAW, Card.Effect.SHUFFLE):
-                            self.assertTrue(
-                                res is None or isinstance(res, str),
-                                msg=f"{cls.__name__}.decide_effect({effect}) should return a player-name str or None, got {res}",
-                            )
-                        elif effect is Card.Effect.SWAP:
-                            # expect tuple (str,int,str,int)
-                            self.assertTrue(
-                                isinstance(res, tuple)
-                                and len(res) == 4
-                                and isinstance(res[0], str)
-                                and isinstance(res[1], int)
-                                and isinstance(res[2], str)
-                                and isinstance(res[3], int),
-                                msg=f"{cls.__name__}.decide_effect(SWAP) should return (str,int,str,int), got {res}",
-                            )
-                        elif effect is Card.Effect.PEEK:
-                            self.assertTrue(
-                                isinstance(res, tuple)
-                                and len(res) == 2
-                                and isinstance(res[0], str)
-                                and isinstance(res[1], int),
-                                msg=f"{cls.__name__}.decide_effect(PEEK) should return (str,int), got {res}",
-                            )
-                        else:
-                            # NONE or other effects: allow None or sensible types
-                            self.assertTrue(
-                                res is None or isinstance(res, (str, tuple, int)),
-                                msg=f"{cls.__name__}.decide_effect({effect}) returned unexpected type: {type(res)}",
-                            )
-
-                    # decide_call -> int in [-1, len(hand)-1]
-                    try:
-                        call_idx = getattr(cls, "decide_call")(public, private)
-                    except NotImplementedError:
-                        self.fail(f"{cls.__name__}.decide_call not implemented")
-                    self.assertIsInstance(call_idx, int)
-                    self.assertGreaterEqual(call_idx, -1)
-                    self.assertLessEqual(call_idx, len(private.hand) - 1)
-
-
-if __name__ == "__main__":
-    unittest.main()
+        unknown = _unknown_hand(len(hand))
+        self.opponents_hands = {"P2": list(unknown), self.name: list(unknown)}
+        self.opponent_names = tuple(self.opponents_hands)
+
+
+_SKIPPED_MODULES = frozenset({"strategy", "human"})
+# The interactive HumanStrategy requires stdin, wherever it is imported
+_SKIPPED_CLASSES = frozenset({"HumanStrategy"})
+
+
+def _discover_strategies() -> tuple[type, ...]:
+    """Return every concrete Strategy subclass under skibidi.strategy."""
+    import importlib
+    import inspect
+    from importlib.resources import files
+
+    from skibidi.strategy.strategy import Strategy
+
+    # Skip package internals and the abstract base module; the interactive
+    # human strategy requires stdin
+    names = sorted(
+        path.name[:-3]
+        for path in files("skibidi.strategy").iterdir()
+        if path.name.endswith(".py")
+        and path.name[:-3] not in _SKIPPED_MODULES
+        and not path.name.startswith("_")
+    )
+    found = {}  # Ordered set, a class may be reachable from several modules
+    for name in names:
+        module = importlib.import_module(f"skibidi.strategy.{name}")
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            # Only collect the classes a module defines, not those it imports
+            if (
+                cls.__module__ == module.__name__
+                and issubclass(cls, Strategy)
+                and cls is not Strategy
+                and cls.__name__ not in _SKIPPED_CLASSES
+            ):
+                found[cls] = None
+    return tuple(found)
+
+
+_CACHE_KEY = "skibidi/strategies"
+_STRATEGIES_KEY = pytest.StashKey[tuple]()
+
+
+def _fingerprint() -> list[list]:
+    """Name and mtime of every module in the strategy package and of this file.
+
+    This file holds the discovery rules, so editing it invalidates the cache too.
+    """
+    from importlib.resources import files
+    from pathlib import Path
+
+    paths = [path for path in files("skibidi.strategy").iterdir() if path.name.endswith(".py")]
+    paths.append(Path(__file__))
+    return sorted([path.name, path.stat().st_mtime_ns] for path in paths)
+
+
+def _cached_strategies(cache) -> tuple[type, ...]:
+    """Discover strategies, reusing the last run's result if no module changed.
+
+    The result is kept in pytest's cache (.pytest_cache) as module and
+    class names, which are resolved again without walking the modules.
+    """
+    import importlib
+
+    fingerprint = _fingerprint()
+    entry = cache.get(_CACHE_KEY, None)
+    if entry is not None and entry["fingerprint"] == fingerprint:
+        try:
+            return tuple(
+                getattr(importlib.import_module(module), qualname)
+                for module, qualname in entry["classes"]
+            )
+        except (ImportError, AttributeError):
+            pass  # Stale entry, fall back to a full discovery
+    found = _discover_strategies()
+    cache.set(
+        _CACHE_KEY,
+        {
+            "fingerprint": fingerprint,
+            "classes": [[cls.__module__, cls.__qualname__] for cls in found],
+        },
+    )
+    return found
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize every test taking `cls` over the discovered strategies."""
+    if "cls" not in metafunc.fixturenames:
+        return
+    stash = metafunc.config.stash
+    if _STRATEGIES_KEY not in stash:
+        cache = getattr(metafunc.config, "cache", None)  # None with -p no:cacheprovider
+        stash[_STRATEGIES_KEY] = (
+            _cached_strategies(cache) if cache is not None else _discover_strategies()
+        )
+    strategies = stash[_STRATEGIES_KEY]
+    if "effect" in metafunc.fixturenames:
+        # One independent test node per (strategy, effect) cell
+        pairs = [(cls, effect) for cls in strategies for effect in _EFFECTS]
+        metafunc.parametrize(
+            "cls, effect",
+            pairs,
+            ids=[f"{cls.__name__}-{effect.name}" for cls, effect in pairs],
+        )
+    else:
+        metafunc.parametrize("cls", strategies, ids=[cls.__name__ for cls in strategies])
+
+
+@pytest.fixture
+def public():
+    return _FakePublicView()
+
+
+@pytest.fixture
+def private():
+    return _FakePrivateView(list(_SAMPLE_HAND))
+
+
+def _shape_ok(res, schema) -> bool:
+    """Whether res is a tuple whose items have exactly the schema's types."""
+    return (
+        isinstance(res, tuple)
+        and len(res) == len(schema)
+        and all(type(x) is t for x, t in zip(res, schema))
+    )
+
+
+def _call(cls, method, *args):
+    try:
+        return getattr(cls, method)(*args)
+    except NotImplementedError:
+        pytest.fail(f"{cls.__name__}.{method} not implemented")
+
+
+@pytest.mark.parametrize("method", REQUIRED_METHODS)
+def test_has_required_method(cls, method):
+    assert hasattr(cls, method), f"{cls.__name__} missing required method: {method}"
+
+
+def test_select_draw_pile(cls, public, private):
+    # expect a Dealer.Source enum
+    src = _call(cls, "select_draw_pile", public, private)
+    assert src in _VALID_SOURCES, f"{cls.__name__}.select_draw_pile returned invalid value: {src}"
+
+
+def test_select_card_to_exchange(cls, public, private):
+    # int in [-1, len(hand)-1]
+    idx = _call(cls, "select_card_to_exchange", public, private, Dealer.Source.DRAW)
+    assert isinstance(idx, int)
+    assert idx >= -1, f"{cls.__name__}.select_card_to_exchange < -1"
+    assert idx <= len(private.hand) - 1, f"{cls.__name__}.select_card_to_exchange >= hand size"
+
+
+def test_select_card_to_discard(cls, public, private):
+    # int in [-1, len(hand)-1]
+    didx = _call(cls, "select_card_to_discard", public, private)
+    assert isinstance(didx, int)
+    assert didx >= -1, f"{cls.__name__}.select_card_to_discard < -1"
+    assert didx <= len(private.hand) - 1, f"{cls.__name__}.select_card_to_discard >= hand size"
+
+
+def test_decide_effect(cls, effect, public, private):
+    res = _call(cls, "decide_effect", public, private, effect)
+    # For DRAW/SHUFFLE expect either None or a player-name string
+    if effect in (Card.Effect.DRAW, Card.Effect.SHUFFLE):
+        assert (
+            res is None or isinstance(res, str)
+        ), f"{cls.__name__}.decide_effect({effect}) should return a player-name str or None, got {res}"
+    elif effect is Card.Effect.SWAP:
+        assert _shape_ok(
+            res, _SWAP_SCHEMA
+        ), f"{cls.__name__}.decide_effect(SWAP) should return (str,int,str,int), got {res}"
+    elif effect is Card.Effect.PEEK:
+        assert _shape_ok(
+            res, _PEEK_SCHEMA
+        ), f"{cls.__name__}.decide_effect(PEEK) should return (str,int), got {res}"
+    else:
+        # NONE or other effects: allow None or sensible types
+        assert res is None or isinstance(
+            res, (str, tuple, int)
+        ), f"{cls.__name__}.decide_effect({effect}) returned unexpected type: {type(res)}"
+
+
+def test_decide_call(cls, public, private):
+    # int in [-1, len(hand)-1]
+    call_idx = _call(cls, "decide_call", public, private)
+    assert isinstance(call_idx, int)
+    assert -1 <= call_idx <= len(private.hand) - 1
+
+
+# Contract of the bundled RandomStrategy
+
+
+@pytest.mark.parametrize("method", REQUIRED_METHODS)
+def test_random_methods_are_static(method):
+    assert isinstance(vars(RandomStrategy)[method], staticmethod)
+
+
+def test_random_discard_matches_rank(public):
+    public.dealer_view.discard_pile = [Card.get(Card.Suit.HEARTS, Card.Rank.THREE)]
+    hand = [
+        Card.get(Card.Suit.CLUBS, Card.Rank.TWO),
+        None,
+        Card.get(Card.Suit.SPADES, Card.Rank.THREE),
+    ]
+    private = _FakePrivateView(hand)
+    results = {RandomStrategy.select_card_to_discard(public, private) for _ in range(100)}
+    assert results <= {-1, 2}
+    assert 2 in results
+
+
+def test_random_select_draw_pile_batch():
+    assert RandomStrategy.select_draw_pile_batch(0) == []
+    sources = RandomStrategy.select_draw_pile_batch(200)
+    assert len(sources) == 200
+    assert set(sources) == _VALID_SOURCES
+
+
+def test_random_empty_hand(public):
+    private = _FakePrivateView([])
+    assert RandomStrategy.select_draw_pile(public, private) == Dealer.Source.DRAW
+    assert RandomStrategy.select_card_to_exchange(public, private, Dealer.Source.DRAW) == -1
+    assert RandomStrategy.decide_effect(public, private, Card.Effect.PEEK) is None
+    assert RandomStrategy.decide_effect(public, private, Card.Effect.SWAP) is None
+    assert RandomStrategy.decide_call(public, private) in (-1, 0)